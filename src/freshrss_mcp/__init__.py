@@ -2,7 +2,14 @@
 
 from .client import AuthenticationError, FreshRSSClient
 from .models import Article, Feed
-from .server import main
+
+
+def main() -> None:
+    """Run the MCP server; FastMCP is imported only when this is called."""
+    from .server import main as run_server
+
+    run_server()
+
 
 __all__ = [
     "main",
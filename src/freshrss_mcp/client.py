@@ -1,33 +1,167 @@
 """FreshRSS API client using Google Reader API."""
 
+import asyncio
+import contextlib
 import logging
+import os
+import re
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+from urllib.parse import quote_plus
 
 import httpx
+import msgspec
+import orjson
+from xxhash import xxh64_intdigest
 
-from .config import Config
-from .models import Article, Feed
+from .models import Article, Feed, RawItem, RawStream, RawStreamItems
+
+if TYPE_CHECKING:
+    from .config import Config
 
 logger = logging.getLogger(__name__)
 
+_STREAM_DECODER = msgspec.json.Decoder(RawStream)
+_STREAM_ITEMS_DECODER = msgspec.json.Decoder(RawStreamItems)
+_ITEM_DECODER = msgspec.json.Decoder(RawItem)
+
+_ITEM_ID_RE = re.compile(r"reader/item/([0-9a-fA-F]+)$")
+_FEED_ID_RE = re.compile(r"(?:feed/)?(-?[0-9]+)")
+
+# Google Reader state streams.
+_READING_LIST: Final = "user/-/state/com.google/reading-list"
+_READ: Final = sys.intern("user/-/state/com.google/read")
+_STARRED: Final = sys.intern("user/-/state/com.google/starred")
+
+
+def _stable_id(value: str) -> int:
+    """Map a non-numeric ID string to a 64-bit integer that is stable across processes.
+
+    A missing (empty) ID maps to 0, so callers can keep treating it as falsy.
+    """
+    if not value:
+        return 0
+    return xxh64_intdigest(value.encode())
+
+
+# Form-encoded "i=tag:google.com,2005:reader/item/" field prefix for edit-tag bodies.
+_ITEM_FIELD = b"i=tag%3Agoogle.com%2C2005%3Areader%2Fitem%2F"
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+
+@lru_cache(maxsize=4096)
+def _extract_feed_id(feed_id_str: str) -> int:
+    """Extract numeric feed ID from Google Reader feed ID format.
+
+    Handles formats like "feed/123" or plain "123".
+    Falls back to a stable hash for non-numeric string IDs.
+    """
+    m = _FEED_ID_RE.fullmatch(feed_id_str)
+    if m:
+        return int(m[1])
+    return _stable_id(feed_id_str.removeprefix("feed/"))
+
+
+@lru_cache(maxsize=4096)
+def _extract_article_id(article_id_str: str) -> int:
+    """Extract numeric article ID from Google Reader format.
+
+    Handles "tag:google.com,2005:reader/item/<id>" where <id>
+    may be decimal or hex.
+    """
+    m = _ITEM_ID_RE.search(article_id_str)
+    if m:
+        raw = m[1]
+        return int(raw) if raw.isdecimal() else int(raw, 16)
+    return _stable_id(article_id_str)
+
+
+def _decode_stream_items(content: bytes) -> list[RawItem]:
+    """Decode /stream/contents items, skipping any that don't fit the schema.
+
+    The whole page is decoded in one pass; only if that fails is it re-read
+    item by item so one malformed entry doesn't sink the rest.
+    """
+    try:
+        return _STREAM_DECODER.decode(content).items
+    except msgspec.ValidationError:
+        pass
+    items: list[RawItem] = []
+    for raw in _STREAM_ITEMS_DECODER.decode(content).items:
+        try:
+            items.append(_ITEM_DECODER.decode(raw))
+        except msgspec.ValidationError as e:
+            logger.warning("Skipping malformed stream item: %s", e)
+    return items
+
+
+# Subscriptions and unread counts are re-fetched at most this often (seconds).
+_CACHE_TTL = 30.0
+
+# A SID persisted to FRESHRSS_SID_CACHE is reused for at most this long (seconds).
+_SID_CACHE_TTL = 3600.0
+
+# Distinct feed names kept for sharing across parsed articles before a reset.
+_FEED_NAMES_MAX = 512
+
 
 class FreshRSSClient:
     """Async client for FreshRSS Google Reader API.
 
     Designed for single-instance lifecycle: create once at startup,
-    authenticate, then reuse for all tool calls.
+    authenticate, then reuse for all tool calls. The underlying HTTP/2
+    connection pool and SID are kept for the process lifetime; an expired
+    SID is refreshed transparently on the first 401.
     """
 
-    def __init__(self, config: Config):
+    def __init__(self, config: "Config"):
         self._config = config
         base_url = config.freshrss_url.rstrip("/")
         api_path = config.freshrss_api_path.rstrip("/")
         self.api_url = f"{base_url}{api_path}"
-        self._auth_token: str | None = None
+        self._auth_token = None  # property; also resets _auth_headers
+        self._sid_cache = Path(config.freshrss_sid_cache) if config.freshrss_sid_cache else None
+        self._auth_lock = asyncio.Lock()
+        self._feeds_cache: tuple[float, list[Feed]] | None = None
+        self._feeds_by_id: dict[int, Feed] = {}  # index over _feeds_cache
+        self._unread_cache: tuple[float, dict[int, int]] | None = None
+        self._unread_gen = 0  # bumped by every tag edit; see get_unread_counts
+        self._read_pending: dict[int, None] = {}  # insertion-ordered set
+        self._read_flush: asyncio.Task[bool] | None = None
+        self._read_inflight: tuple[set[int], asyncio.Task[bool]] | None = None
+        self._feed_names: dict[str, str] = {}
+        self._mark_chunk_size = config.mark_chunk_size
         self._client = httpx.AsyncClient(
             base_url=base_url,
-            timeout=30.0,
+            timeout=httpx.Timeout(30.0, connect=5.0),
             follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=20, max_connections=40, keepalive_expiry=60.0
+            ),
         )
+        # Every API call goes through these; the pool is never swapped out.
+        self._get = self._client.get
+        self._post = self._client.post
+
+    @property
+    def _auth_token(self) -> str | None:
+        return self._token
+
+    @_auth_token.setter
+    def _auth_token(self, token: str | None) -> None:
+        # Build the Authorization header once per SID rather than per request.
+        self._token = token
+        self._auth_headers = {"Authorization": f"GoogleLogin auth={token}"} if token else None
+
+    async def __aenter__(self) -> "FreshRSSClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
 
     async def authenticate(self) -> str:
         """Authenticate with FreshRSS and obtain auth token.
@@ -42,7 +176,7 @@ class FreshRSSClient:
         logger.debug("Authenticating to %s", auth_url)
 
         try:
-            response = await self._client.post(
+            response = await self._post(
                 auth_url,
                 data={
                     "Email": self._config.freshrss_username,
@@ -51,10 +185,11 @@ class FreshRSSClient:
             )
             response.raise_for_status()
 
-            for line in response.text.split("\n"):
-                if line.startswith("SID="):
-                    self._auth_token = line[4:]
+            for line in response.content.splitlines():
+                if line.startswith(b"SID="):
+                    self._auth_token = line[4:].decode()
                     logger.info("Authentication successful")
+                    self._store_cached_sid(self._auth_token)
                     return self._auth_token
 
             raise AuthenticationError("No SID found in authentication response")
@@ -67,37 +202,105 @@ class FreshRSSClient:
             raise AuthenticationError(f"Authentication error: {e}") from e
 
     async def _ensure_authenticated(self) -> None:
-        """Authenticate lazily if no token is held yet."""
-        if not self._auth_token:
-            await self.authenticate()
+        """Authenticate lazily if no token is held yet.
+
+        Concurrent callers share a single login round trip, and a fresh SID
+        left in the cache file by another worker skips the login entirely.
+        """
+        if self._auth_token:
+            return
+        async with self._auth_lock:
+            if not self._auth_token:
+                self._auth_token = self._load_cached_sid()
+            if not self._auth_token:
+                await self.authenticate()
+
+    def _load_cached_sid(self) -> str | None:
+        """Read a still-fresh SID from the cache file, if one is configured."""
+        if self._sid_cache is None:
+            return None
+        try:
+            if time.time() - self._sid_cache.stat().st_mtime >= _SID_CACHE_TTL:
+                return None
+            return self._sid_cache.read_text().strip() or None
+        except OSError:
+            return None
+
+    def _store_cached_sid(self, token: str) -> None:
+        """Atomically write the SID to the cache file (mode 0600)."""
+        if self._sid_cache is None:
+            return
+        tmp = self._sid_cache.with_name(f"{self._sid_cache.name}.{os.getpid()}.tmp")
+        try:
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                f.write(token)
+            os.replace(tmp, self._sid_cache)
+        except OSError as e:
+            logger.warning("Could not write SID cache %s: %s", self._sid_cache, e)
+
+    def _drop_cached_sid(self, token: str) -> None:
+        """Remove the cache file if it still holds the given (rejected) SID."""
+        if self._sid_cache is not None and self._load_cached_sid() == token:
+            with contextlib.suppress(OSError):
+                self._sid_cache.unlink()
 
     def _get_auth_headers(self) -> dict[str, str]:
         """Get headers with authentication token."""
-        if not self._auth_token:
+        if self._auth_headers is None:
             raise AuthenticationError("Not authenticated. Call authenticate() first.")
-        return {"Authorization": f"GoogleLogin auth={self._auth_token}"}
+        return self._auth_headers
+
+    async def _request(
+        self, method: str, url: str, headers: dict[str, str] | None = None, **kwargs
+    ) -> httpx.Response:
+        """Send an authenticated request, re-authenticating once on 401."""
+        await self._ensure_authenticated()
+        send = self._get if method == "GET" else self._post
+        token = self._auth_token
+        auth = self._get_auth_headers()
+        response = await send(url, headers={**auth, **headers} if headers else auth, **kwargs)
+        if response.status_code == 401:
+            logger.info("Session expired, re-authenticating")
+            if self._auth_token == token:
+                self._auth_token = None
+                self._drop_cached_sid(token)
+            await self._ensure_authenticated()
+            auth = self._get_auth_headers()
+            response = await send(url, headers={**auth, **headers} if headers else auth, **kwargs)
+        response.raise_for_status()
+        return response
 
     async def list_feeds(self) -> list[Feed]:
         """List all subscribed feeds."""
-        await self._ensure_authenticated()
-        headers = self._get_auth_headers()
-        url = f"{self.api_url}/reader/api/0/subscription/list"
+        if self._feeds_cache and time.monotonic() - self._feeds_cache[0] < _CACHE_TTL:
+            return list(self._feeds_cache[1])
 
-        response = await self._client.get(url, headers=headers, params={"output": "json"})
-        response.raise_for_status()
+        url = f"{self.api_url}/reader/api/0/subscription/list"
+        response = await self._request("GET", url, params={"output": "json"})
 
-        data = response.json()
+        data = orjson.loads(response.content)
         feeds = []
         for sub in data.get("subscriptions", []):
             feed = Feed(
-                id=self._extract_feed_id(sub.get("id", "")),
+                id=_extract_feed_id(sub.get("id", "")),
                 name=sub.get("title", "Unknown"),
                 url=sub.get("url", ""),
             )
             feeds.append(feed)
 
         logger.info("Retrieved %d feeds", len(feeds))
-        return feeds
+        self._feeds_cache = (time.monotonic(), feeds)
+        self._feeds_by_id = {feed.id: feed for feed in feeds}
+        return list(feeds)
+
+    async def get_feed(self, feed_id: int) -> Feed | None:
+        """Look up a subscribed feed by ID, or None if it is not subscribed.
+
+        The Feed is the cached instance shared with list_feeds; do not mutate it.
+        """
+        await self.list_feeds()
+        return self._feeds_by_id.get(feed_id)
 
     async def get_unread_counts(self) -> dict[int, int]:
         """Get unread article counts per feed.
@@ -105,22 +308,26 @@ class FreshRSSClient:
         Returns:
             Dictionary mapping feed_id to unread count
         """
-        await self._ensure_authenticated()
-        headers = self._get_auth_headers()
-        url = f"{self.api_url}/reader/api/0/unread-count"
+        if self._unread_cache and time.monotonic() - self._unread_cache[0] < _CACHE_TTL:
+            return dict(self._unread_cache[1])
 
-        response = await self._client.get(url, headers=headers, params={"output": "json"})
-        response.raise_for_status()
+        # An edit that finishes while this fetch is in flight makes the
+        # response stale: return it, but don't cache it past the edit.
+        gen = self._unread_gen
+        url = f"{self.api_url}/reader/api/0/unread-count"
+        response = await self._request("GET", url, params={"output": "json"})
 
-        data = response.json()
+        data = orjson.loads(response.content)
         unread_counts: dict[int, int] = {}
         for item in data.get("unreadcounts", []):
-            feed_id = self._extract_feed_id(item.get("id", ""))
+            feed_id = _extract_feed_id(item.get("id", ""))
             count = item.get("count", 0)
             if feed_id:
                 unread_counts[feed_id] = count
 
-        return unread_counts
+        if gen == self._unread_gen:
+            self._unread_cache = (time.monotonic(), unread_counts)
+        return dict(unread_counts)
 
     async def get_articles(
         self,
@@ -137,45 +344,87 @@ class FreshRSSClient:
             include_read: Whether to include read articles
             since_timestamp: Only return articles published after this timestamp
         """
-        await self._ensure_authenticated()
-        headers = self._get_auth_headers()
-        stream_id = f"feed/{feed_id}" if feed_id else "user/-/state/com.google/reading-list"
+        stream_id = f"feed/{feed_id}" if feed_id else _READING_LIST
         url = f"{self.api_url}/reader/api/0/stream/contents/{stream_id}"
 
         params: dict[str, str | int] = {"output": "json", "n": limit}
         if not include_read:
-            params["xt"] = "user/-/state/com.google/read"
+            params["xt"] = _READ
         if since_timestamp:
             params["ot"] = since_timestamp
 
-        response = await self._client.get(url, headers=headers, params=params)
-        response.raise_for_status()
+        response = await self._request("GET", url, params=params)
 
-        data = response.json()
-        articles = []
-        for item in data.get("items", []):
-            article = self._parse_article(item)
-            if article:
-                articles.append(article)
+        items = _decode_stream_items(response.content)
+        if len(self._feed_names) > _FEED_NAMES_MAX:
+            self._feed_names.clear()
+        articles = [self._parse_article(item) for item in items]
 
         logger.info("Retrieved %d articles", len(articles))
         return articles
 
+    async def get_overview(
+        self, limit: int = 20
+    ) -> tuple[list[Feed], dict[int, int], list[Article]]:
+        """Fetch feeds, unread counts and the latest unread articles concurrently.
+
+        Args:
+            limit: Maximum number of articles to return
+
+        Returns:
+            Tuple of (feeds, unread counts by feed ID, articles)
+        """
+        return await asyncio.gather(
+            self.list_feeds(), self.get_unread_counts(), self.get_articles(limit=limit)
+        )
+
     async def mark_as_read(self, article_ids: list[int]) -> bool:
-        """Mark articles as read."""
-        return await self._edit_tags(article_ids, add_tags=["user/-/state/com.google/read"])
+        """Mark articles as read.
+
+        Concurrent calls are coalesced into a single edit-tag request: IDs
+        queue up while the previous mark-as-read POST is in flight and go out
+        together once it finishes. Every caller awaits its batch's result.
+        """
+        if not article_ids:
+            return True
+        self._read_pending.update(dict.fromkeys(article_ids))
+        if self._read_flush is None:
+            self._read_flush = asyncio.create_task(self._flush_mark_read())
+        return await asyncio.shield(self._read_flush)
+
+    async def _flush_mark_read(self) -> bool:
+        """Send all pending mark-as-read IDs after any read POST still in flight."""
+        if self._read_inflight is not None:
+            await asyncio.wait([self._read_inflight[1]])
+        article_ids = list(self._read_pending)
+        self._read_pending = {}
+        self._read_flush = None
+        if not article_ids:
+            return True
+        self._read_inflight = (set(article_ids), asyncio.current_task())
+        try:
+            return await self._edit_tags(article_ids, add_tags=[_READ])
+        finally:
+            self._read_inflight = None
 
     async def mark_as_unread(self, article_ids: list[int]) -> bool:
         """Mark articles as unread."""
-        return await self._edit_tags(article_ids, remove_tags=["user/-/state/com.google/read"])
+        # A mark-as-read for the same IDs must not land after this call: drop
+        # them from the queued batch, or wait out a POST already carrying them.
+        for aid in article_ids:
+            self._read_pending.pop(aid, None)
+        inflight = self._read_inflight
+        if inflight is not None and not inflight[0].isdisjoint(article_ids):
+            await asyncio.wait([inflight[1]])
+        return await self._edit_tags(article_ids, remove_tags=[_READ])
 
     async def star_article(self, article_id: int) -> bool:
         """Star an article."""
-        return await self._edit_tags([article_id], add_tags=["user/-/state/com.google/starred"])
+        return await self._edit_tags([article_id], add_tags=[_STARRED])
 
     async def unstar_article(self, article_id: int) -> bool:
         """Unstar an article."""
-        return await self._edit_tags([article_id], remove_tags=["user/-/state/com.google/starred"])
+        return await self._edit_tags([article_id], remove_tags=[_STARRED])
 
     async def _edit_tags(
         self,
@@ -183,88 +432,52 @@ class FreshRSSClient:
         add_tags: list[str] | None = None,
         remove_tags: list[str] | None = None,
     ) -> bool:
-        """Edit tags on articles."""
-        await self._ensure_authenticated()
-        headers = self._get_auth_headers()
-        url = f"{self.api_url}/reader/api/0/edit-tag"
-
-        item_ids = [f"tag:google.com,2005:reader/item/{aid}" for aid in article_ids]
-        data: dict[str, list[str]] = {"i": item_ids}
-        if add_tags:
-            data["a"] = add_tags
-        if remove_tags:
-            data["r"] = remove_tags
+        """Edit tags on articles.
 
-        response = await self._client.post(url, headers=headers, data=data)
-        response.raise_for_status()
+        Large batches are split into chunks of MCP_MARK_CHUNK_SIZE IDs,
+        posted concurrently, to stay under FreshRSS's request size limits.
+        """
+        url = f"{self.api_url}/reader/api/0/edit-tag"
 
-        logger.info("Updated tags for %d articles", len(article_ids))
-        return True
+        item_parts = [_ITEM_FIELD + str(aid).encode() for aid in article_ids]
+        tag_parts = [b"a=" + quote_plus(tag).encode() for tag in add_tags or ()]
+        tag_parts += [b"r=" + quote_plus(tag).encode() for tag in remove_tags or ()]
 
-    def _parse_article(self, item: dict) -> Article | None:
-        """Parse a FreshRSS article item into an Article model."""
+        size = self._mark_chunk_size
+        bodies = [
+            b"&".join(item_parts[i : i + size] + tag_parts) for i in range(0, len(item_parts), size)
+        ]
         try:
-            article_id = self._extract_article_id(item.get("id", ""))
-            origin = item.get("origin", {})
-            feed_name = origin.get("title", "Unknown Feed")
-
-            summary = ""
-            content = item.get("summary", {})
-            if content:
-                summary = content.get("content", "")
-
-            categories = item.get("categories", [])
-            is_read = "user/-/state/com.google/read" in categories
-            is_starred = "user/-/state/com.google/starred" in categories
-
-            alternates = item.get("alternate", [])
-            url = alternates[0].get("href", "") if alternates else ""
-
-            return Article(
-                id=article_id,
-                title=item.get("title", "Untitled"),
-                summary=summary,
-                url=url,
-                published=item.get("published", 0),
-                feed_name=feed_name,
-                is_read=is_read,
-                is_starred=is_starred,
+            await asyncio.gather(
+                *(
+                    self._request("POST", url, headers=_FORM_HEADERS, content=body)
+                    for body in bodies
+                )
             )
-        except Exception as e:
-            logger.warning("Failed to parse article: %s", e)
-            return None
-
-    @staticmethod
-    def _extract_feed_id(feed_id_str: str) -> int:
-        """Extract numeric feed ID from Google Reader feed ID format.
-
-        Handles formats like "feed/123" or plain "123".
-        Falls back to hash for non-numeric string IDs.
-        """
-        if feed_id_str.startswith("feed/"):
-            feed_id_str = feed_id_str[5:]
-        try:
-            return int(feed_id_str)
-        except ValueError:
-            return hash(feed_id_str) % 1_000_000
+        finally:
+            # Some chunks may have landed even if another failed.
+            self._unread_cache = None
+            self._unread_gen += 1
 
-    @staticmethod
-    def _extract_article_id(article_id_str: str) -> int:
-        """Extract numeric article ID from Google Reader format.
+        logger.info("Updated tags for %d articles", len(article_ids))
+        return True
 
-        Handles "tag:google.com,2005:reader/item/<id>" where <id>
-        may be decimal or hex.
-        """
-        if "reader/item/" in article_id_str:
-            raw = article_id_str.split("/")[-1]
-            try:
-                return int(raw)
-            except ValueError:
-                try:
-                    return int(raw, 16)
-                except ValueError:
-                    pass
-        return hash(article_id_str) % 1_000_000_000
+    def _parse_article(self, item: RawItem) -> Article:
+        """Build an Article from a decoded stream item."""
+        categories = item.categories
+        # Articles from the same feed share one feed_name string object.
+        feed_name = item.origin.title if item.origin else "Unknown Feed"
+        feed_name = self._feed_names.setdefault(feed_name, feed_name)
+        return Article(
+            id=_extract_article_id(item.id),
+            title=item.title,
+            summary=item.summary.content if item.summary else "",
+            url=item.alternate[0].href if item.alternate else "",
+            published=item.published,
+            feed_name=feed_name,
+            is_read=_READ in categories,
+            is_starred=_STARRED in categories,
+        )
 
     async def aclose(self) -> None:
         """Close the HTTP client."""
@@ -16,8 +16,11 @@ class Config(BaseSettings):
     freshrss_username: str = Field(alias="FRESHRSS_USERNAME")
     freshrss_password: SecretStr = Field(alias="FRESHRSS_PASSWORD")
     freshrss_api_path: str = Field(default="/api/greader.php", alias="FRESHRSS_API_PATH")
+    freshrss_sid_cache: str | None = Field(default=None, alias="FRESHRSS_SID_CACHE")
     server_host: str = Field(default="127.0.0.1", alias="MCP_SERVER_HOST")
     server_port: int = Field(default=8000, alias="MCP_SERVER_PORT")
+    max_concurrent_feeds: int = Field(default=8, ge=1, alias="MCP_MAX_CONCURRENT_FEEDS")
+    mark_chunk_size: int = Field(default=250, ge=1, alias="MCP_MARK_CHUNK_SIZE")
 
     model_config = SettingsConfigDict(
         populate_by_name=True,
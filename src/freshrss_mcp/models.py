@@ -1,12 +1,43 @@
 """Data models for FreshRSS MCP Server."""
 
-from dataclasses import dataclass
+from typing import ClassVar
 
+import msgspec
 
-@dataclass
-class Article:
+
+def _gen_to_dict[T](cls: type[T]) -> type[T]:
+    """Attach a straight-line to_dict built from cls._FIELDS.
+
+    Like dataclasses' generated __init__, the method body is compiled once
+    at import time so each call is a single dict display with no loop or
+    getattr lookups.
+    """
+    items = ", ".join(f"{name!r}: self.{name}" for name in cls._FIELDS)
+    namespace: dict[str, object] = {}
+    exec(f"def to_dict(self) -> dict:\n    return {{{items}}}\n", namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    to_dict.__doc__ = "Return the serialized form as a plain dict."
+    cls.to_dict = to_dict
+    return cls
+
+
+@_gen_to_dict
+class Article(msgspec.Struct, frozen=True):
     """Represents a FreshRSS article with minimal fields for token efficiency."""
 
+    # Fields emitted by to_dict, in output order.
+    _FIELDS: ClassVar[tuple[str, ...]] = (
+        "id",
+        "title",
+        "summary",
+        "url",
+        "published",
+        "feed_name",
+        "is_read",
+        "is_starred",
+    )
+
     id: int
     title: str
     summary: str
@@ -16,32 +47,59 @@ class Article:
     is_read: bool
     is_starred: bool
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "summary": self.summary,
-            "url": self.url,
-            "published": self.published,
-            "feed_name": self.feed_name,
-            "is_read": self.is_read,
-            "is_starred": self.is_starred,
-        }
 
+@_gen_to_dict
+class Feed(msgspec.Struct, frozen=True):
+    """Represents a FreshRSS feed.
+
+    Unread counts change far more often than subscriptions, so they are not
+    stored here; tools merge them in from get_unread_counts when serializing.
+    """
 
-@dataclass
-class Feed:
-    """Represents a FreshRSS feed."""
+    _FIELDS: ClassVar[tuple[str, ...]] = ("id", "name", "url")
 
     id: int
     name: str
     url: str
-    unread_count: int = 0
-
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "name": self.name,
-            "url": self.url,
-            "unread_count": self.unread_count,
-        }
+
+
+# --- Raw Google Reader stream schema ---
+#
+# Only the fields _parse_article reads are declared; msgspec skips
+# everything else in the payload without allocating Python objects for it.
+
+
+class RawSummary(msgspec.Struct):
+    content: str = ""
+
+
+class RawAlternate(msgspec.Struct):
+    href: str = ""
+
+
+class RawOrigin(msgspec.Struct):
+    title: str = "Unknown Feed"
+
+
+class RawItem(msgspec.Struct):
+    """A single item from /stream/contents."""
+
+    id: str = ""
+    title: str = "Untitled"
+    summary: RawSummary | None = None
+    alternate: list[RawAlternate] = []
+    origin: RawOrigin | None = None
+    categories: list[str] = []
+    published: int = 0
+
+
+class RawStream(msgspec.Struct):
+    """Top-level /stream/contents response."""
+
+    items: list[RawItem] = []
+
+
+class RawStreamItems(msgspec.Struct):
+    """/stream/contents with items left undecoded, to validate one at a time."""
+
+    items: list[msgspec.Raw] = []
@@ -8,8 +8,7 @@ import asyncio
 import logging
 import signal
 import sys
-
-from fastmcp import FastMCP
+from collections.abc import Callable
 
 from .client import FreshRSSClient
 from .config import load_config
@@ -23,32 +22,52 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory when available (not on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def main() -> None:
     """Run the FreshRSS MCP server."""
+    # Imported here so library users of FreshRSSClient don't pay for FastMCP.
+    from fastmcp import FastMCP
+
     config = load_config()
     client = FreshRSSClient(config)
 
     mcp = FastMCP("freshrss-mcp")
-    register_tools(mcp, client)
+    register_tools(mcp, client, max_concurrent_feeds=config.max_concurrent_feeds)
 
     def handle_shutdown(signum: int, frame: object) -> None:
+        # uvicorn swaps in its own handlers while serving, then restores these
+        # and re-raises the signal once it has shut down. Only log here: the
+        # default actions would kill the process (SIGTERM) or raise
+        # KeyboardInterrupt (SIGINT) before the client is closed.
         logger.info("Received shutdown signal, closing connections...")
-        asyncio.run(client.aclose())
-        sys.exit(0)
 
     signal.signal(signal.SIGTERM, handle_shutdown)
     signal.signal(signal.SIGINT, handle_shutdown)
 
+    async def serve() -> None:
+        try:
+            await mcp.run_async(
+                transport="streamable-http",
+                host=config.server_host,
+                port=config.server_port,
+            )
+        finally:
+            await asyncio.shield(client.aclose())
+
     logger.info(
         "Starting FreshRSS MCP server on %s:%d (streamable-http)",
         config.server_host,
         config.server_port,
     )
-    mcp.run(
-        transport="streamable-http",
-        host=config.server_host,
-        port=config.server_port,
-    )
+    asyncio.run(serve(), loop_factory=_loop_factory())
 
 
 if __name__ == "__main__":
@@ -5,24 +5,155 @@ tool boundary and returned as "Error: ..." strings so the MCP protocol
 never sees an uncaught exception.
 """
 
+import asyncio
+import heapq
+import itertools
 import logging
+from operator import attrgetter
+from typing import TYPE_CHECKING
 
-from fastmcp import FastMCP
+import msgspec
 
-from .client import FreshRSSClient
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+
+    from .client import FreshRSSClient
+    from .models import Article, Feed
 
 logger = logging.getLogger(__name__)
 
+# Extra articles requested per feed on top of its even share of the limit.
+_PER_FEED_SLACK = 5
+
+_published = attrgetter("published")
+
 
 def _truncate_summary(summary: str, max_length: int) -> str:
     """Truncate summary to max_length at a word boundary."""
     if len(summary) <= max_length:
         return summary
-    return summary[:max_length].rsplit(" ", 1)[0] + "..."
+    cut = summary.rfind(" ", 0, max_length)
+    return summary[: cut if cut >= 0 else max_length] + "..."
+
+
+def _truncated_row(article: "Article", max_summary_length: int) -> dict[str, object]:
+    """Serialize an article with its summary truncated, building a single dict."""
+    row = article.to_dict()
+    row["summary"] = _truncate_summary(article.summary, max_summary_length)
+    return row
+
+
+def _feed_row(feed: "Feed", unread_count: int) -> dict[str, object]:
+    """Serialize a feed together with its unread count."""
+    row = feed.to_dict()
+    row["unread_count"] = unread_count
+    return row
+
+
+_encode = msgspec.json.Encoder().encode
+
+
+def _json(payload: object) -> str:
+    """Serialize a tool result as JSON text. Article structs encode natively."""
+    return _encode(payload).decode()
+
+
+async def _fetch_feeds(
+    client: "FreshRSSClient",
+    feed_ids: list[int],
+    sem: asyncio.Semaphore,
+    **kwargs: object,
+) -> dict[int, list["Article"]]:
+    """Fetch articles for several feeds concurrently, keyed by feed ID.
+
+    At most sem's worth of feed requests are in flight at once and repeated
+    feed IDs are fetched once. A feed that fails is logged and left out so
+    one bad feed does not sink the whole call; if every feed fails, the
+    first error is raised.
+    """
+
+    async def fetch(fid: int) -> list["Article"]:
+        async with sem:
+            return await client.get_articles(feed_id=fid, **kwargs)
+
+    feed_ids = list(dict.fromkeys(feed_ids))
+    results = await asyncio.gather(*map(fetch, feed_ids), return_exceptions=True)
+    by_feed: dict[int, list[Article]] = {}
+    errors: list[BaseException] = []
+    for fid, result in zip(feed_ids, results, strict=True):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            logger.warning("Fetching feed %s failed: %s", fid, result)
+            errors.append(result)
+        else:
+            by_feed[fid] = result
+    if errors and len(errors) == len(feed_ids):
+        raise errors[0]
+    return by_feed
+
+
+def _merge_articles(by_feed: dict[int, list["Article"]]) -> list["Article"]:
+    """Concatenate per-feed results, keeping an article seen under several feeds once."""
+    return list({a.id: a for a in itertools.chain.from_iterable(by_feed.values())}.values())
+
+
+async def _get_feeds_articles(
+    client: "FreshRSSClient",
+    feed_ids: list[int],
+    sem: asyncio.Semaphore,
+    **kwargs: object,
+) -> list["Article"]:
+    """Fetch articles for several feeds concurrently and concatenate them."""
+    return _merge_articles(await _fetch_feeds(client, feed_ids, sem, **kwargs))
+
+
+async def _get_newest_articles(
+    client: "FreshRSSClient",
+    feed_ids: list[int],
+    sem: asyncio.Semaphore,
+    limit: int,
+    **kwargs: object,
+) -> list["Article"]:
+    """Return the newest limit articles across feed_ids, newest first.
+
+    Each feed is first asked for only its share of limit (plus some slack).
+    A feed that filled its allotment and whose oldest article would still
+    make the cut may be hiding newer-than-cutoff articles, so just those
+    feeds are re-fetched with a doubled allotment until the result is
+    settled or the allotment reaches limit itself.
+    """
+    feed_ids = list(dict.fromkeys(feed_ids))
+    per_feed = min(limit, limit // len(feed_ids) + _PER_FEED_SLACK)
+    by_feed = await _fetch_feeds(client, feed_ids, sem, limit=per_feed, **kwargs)
+    while True:
+        newest = heapq.nlargest(limit, _merge_articles(by_feed), key=_published)
+        if per_feed >= limit:
+            return newest
+        cutoff = newest[-1].published if len(newest) == limit else None
+        short = [
+            fid
+            for fid, articles in by_feed.items()
+            if len(articles) >= per_feed
+            and (cutoff is None or min(map(_published, articles)) >= cutoff)
+        ]
+        if not short:
+            return newest
+        per_feed = min(limit, per_feed * 2)
+        try:
+            by_feed.update(await _fetch_feeds(client, short, sem, limit=per_feed, **kwargs))
+        except Exception:
+            # Already logged per feed; keep what the earlier rounds returned.
+            return newest
 
 
-def register_tools(mcp: FastMCP, client: FreshRSSClient) -> None:
-    """Register all FreshRSS tools on the given MCP server instance."""
+def register_tools(mcp: "FastMCP", client: "FreshRSSClient", max_concurrent_feeds: int = 8) -> None:
+    """Register all FreshRSS tools on the given MCP server instance.
+
+    max_concurrent_feeds caps the per-feed requests in flight across every
+    tool that fans out over feed_ids, so a long list cannot flood FreshRSS.
+    """
+    feed_sem = asyncio.Semaphore(max_concurrent_feeds)
 
     @mcp.tool()
     async def get_unread_articles(
@@ -44,17 +175,14 @@ def register_tools(mcp: FastMCP, client: FreshRSSClient) -> None:
         """
         try:
             if feed_ids:
-                all_articles = []
-                for fid in feed_ids:
-                    articles = await client.get_articles(
-                        feed_id=fid,
-                        limit=limit,
-                        include_read=False,
-                        since_timestamp=since_timestamp,
-                    )
-                    all_articles.extend(articles)
-                all_articles.sort(key=lambda a: a.published, reverse=True)
-                articles = all_articles[:limit]
+                articles = await _get_newest_articles(
+                    client,
+                    feed_ids,
+                    feed_sem,
+                    limit,
+                    include_read=False,
+                    since_timestamp=since_timestamp,
+                )
             else:
                 articles = await client.get_articles(
                     limit=limit,
@@ -62,13 +190,7 @@ def register_tools(mcp: FastMCP, client: FreshRSSClient) -> None:
                     since_timestamp=since_timestamp,
                 )
 
-            result = []
-            for article in articles:
-                d = article.to_dict()
-                d["summary"] = _truncate_summary(d["summary"], max_summary_length)
-                result.append(d)
-
-            return str(result)
+            return _json([_truncated_row(a, max_summary_length) for a in articles])
         except Exception as e:
             logger.error("get_unread_articles failed: %s", e, exc_info=True)
             return f"Error: {e}"
@@ -92,7 +214,7 @@ def register_tools(mcp: FastMCP, client: FreshRSSClient) -> None:
             articles = await client.get_articles(
                 feed_id=feed_id, limit=limit, include_read=include_read
             )
-            return str([a.to_dict() for a in articles])
+            return _json(articles)
         except Exception as e:
             logger.error("get_articles_by_feed failed: %s", e, exc_info=True)
             return f"Error: {e}"
@@ -117,22 +239,18 @@ def register_tools(mcp: FastMCP, client: FreshRSSClient) -> None:
         try:
             fetch_limit = limit * 3
             if feed_ids:
-                all_articles = []
-                for fid in feed_ids:
-                    articles = await client.get_articles(
-                        feed_id=fid, limit=fetch_limit, include_read=True
-                    )
-                    all_articles.extend(articles)
+                all_articles = await _get_feeds_articles(
+                    client, feed_ids, feed_sem, limit=fetch_limit, include_read=True
+                )
             else:
                 all_articles = await client.get_articles(limit=fetch_limit, include_read=True)
 
-            query_lower = query.lower()
-            matching = [
-                a
-                for a in all_articles
-                if query_lower in a.title.lower() or query_lower in a.summary.lower()
-            ]
-            return str([a.to_dict() for a in matching[:limit]])
+            q = query.casefold()
+            matching = (
+                a for a in all_articles if q in a.title.casefold() or q in a.summary.casefold()
+            )
+            # islice stops scanning as soon as limit matches are found.
+            return _json(list(itertools.islice(matching, limit)))
         except Exception as e:
             logger.error("search_articles failed: %s", e, exc_info=True)
             return f"Error: {e}"
@@ -145,11 +263,11 @@ def register_tools(mcp: FastMCP, client: FreshRSSClient) -> None:
         and unread_count fields.
         """
         try:
-            feeds = await client.list_feeds()
-            unread_counts = await client.get_unread_counts()
-            for feed in feeds:
-                feed.unread_count = unread_counts.get(feed.id, 0)
-            return str([f.to_dict() for f in feeds])
+            feeds, unread_counts = await asyncio.gather(
+                client.list_feeds(), client.get_unread_counts()
+            )
+            get_count = unread_counts.get
+            return _json([_feed_row(f, get_count(f.id, 0)) for f in feeds])
         except Exception as e:
             logger.error("list_feeds failed: %s", e, exc_info=True)
             return f"Error: {e}"
@@ -164,13 +282,12 @@ def register_tools(mcp: FastMCP, client: FreshRSSClient) -> None:
         Returns a JSON-formatted feed object, or an error if the feed is not found.
         """
         try:
-            feeds = await client.list_feeds()
-            unread_counts = await client.get_unread_counts()
-            for feed in feeds:
-                if feed.id == feed_id:
-                    feed.unread_count = unread_counts.get(feed.id, 0)
-                    return str(feed.to_dict())
-            return f"Error: Feed {feed_id} not found"
+            feed, unread_counts = await asyncio.gather(
+                client.get_feed(feed_id), client.get_unread_counts()
+            )
+            if feed is None:
+                return f"Error: Feed {feed_id} not found"
+            return _json(_feed_row(feed, unread_counts.get(feed.id, 0)))
         except Exception as e:
             logger.error("get_feed_info failed: %s", e, exc_info=True)
             return f"Error: {e}"
@@ -183,18 +300,16 @@ def register_tools(mcp: FastMCP, client: FreshRSSClient) -> None:
         and unread_count fields.
         """
         try:
-            feeds = await client.list_feeds()
-            unread_counts = await client.get_unread_counts()
-            result = []
-            for feed in feeds:
-                result.append(
-                    {
-                        "feed_id": feed.id,
-                        "feed_name": feed.name,
-                        "unread_count": unread_counts.get(feed.id, 0),
-                    }
-                )
-            return str(result)
+            feeds, unread_counts = await asyncio.gather(
+                client.list_feeds(), client.get_unread_counts()
+            )
+            get_count = unread_counts.get
+            return _json(
+                [
+                    {"feed_id": f.id, "feed_name": f.name, "unread_count": get_count(f.id, 0)}
+                    for f in feeds
+                ]
+            )
         except Exception as e:
             logger.error("get_feed_stats failed: %s", e, exc_info=True)
             return f"Error: {e}"
@@ -1,12 +1,22 @@
-"""Tests for client.py — FreshRSS API client with mocked HTTP."""
+"""Tests for client.py — FreshRSS API client with HTTP mocked by respx."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
 
-import httpx
+import msgspec
 import pytest
-
-from freshrss_mcp.client import AuthenticationError, FreshRSSClient
+import respx
+
+from freshrss_mcp.client import (
+    AuthenticationError,
+    FreshRSSClient,
+    _extract_article_id,
+    _extract_feed_id,
+    _stable_id,
+)
 from freshrss_mcp.config import Config
+from freshrss_mcp.models import RawItem
+
+API = "https://test.freshrss.com/api/greader.php"
 
 
 @pytest.fixture
@@ -23,114 +33,226 @@ def client(config):
     return FreshRSSClient(config)
 
 
+@pytest.fixture
+def api():
+    """Intercept httpx at the transport layer for the Google Reader API."""
+    with respx.mock(base_url=API, assert_all_called=False) as mock:
+        yield mock
+
+
 # --- Authentication ---
 
 
-@pytest.mark.asyncio
-async def test_authenticate_success(client):
-    mock_response = MagicMock()
-    mock_response.text = "SID=abc123\nLSID=def456\nAuth=ghi789"
-    mock_response.raise_for_status = MagicMock()
+async def test_authenticate_success(client, api):
+    login = api.post("/accounts/ClientLogin").respond(
+        200, content=b"SID=abc123\nLSID=def456\nAuth=ghi789"
+    )
 
-    with patch.object(client._client, "post", new_callable=AsyncMock, return_value=mock_response):
-        token = await client.authenticate()
+    token = await client.authenticate()
 
     assert token == "abc123"
     assert client._auth_token == "abc123"
+    assert login.calls.last.request.content == b"Email=testuser&Passwd=testpass"
 
 
-@pytest.mark.asyncio
-async def test_authenticate_no_sid(client):
+async def test_authenticate_no_sid(client, api):
     """Response without SID raises AuthenticationError."""
-    mock_response = MagicMock()
-    mock_response.text = "Auth=ghi789\nLSID=def456"
-    mock_response.raise_for_status = MagicMock()
-
-    with (
-        patch.object(client._client, "post", new_callable=AsyncMock, return_value=mock_response),
-        pytest.raises(AuthenticationError, match="No SID found"),
-    ):
+    api.post("/accounts/ClientLogin").respond(200, content=b"Auth=ghi789\nLSID=def456")
+
+    with pytest.raises(AuthenticationError, match="No SID found"):
         await client.authenticate()
 
 
-@pytest.mark.asyncio
-async def test_authenticate_http_error(client):
-    mock_response = MagicMock()
-    mock_response.status_code = 403
-    mock_response.raise_for_status = MagicMock(
-        side_effect=httpx.HTTPStatusError("Forbidden", request=MagicMock(), response=mock_response)
-    )
+async def test_authenticate_http_error(client, api):
+    api.post("/accounts/ClientLogin").respond(403)
 
-    with (
-        patch.object(client._client, "post", new_callable=AsyncMock, return_value=mock_response),
-        pytest.raises(AuthenticationError, match="403"),
-    ):
+    with pytest.raises(AuthenticationError, match="403"):
         await client.authenticate()
 
 
-@pytest.mark.asyncio
+async def test_sid_cache_shared_between_clients(tmp_path, api):
+    """A SID written by one client is reused by the next without logging in."""
+    cache = tmp_path / "sid"
+    config = Config(
+        FRESHRSS_URL="https://test.freshrss.com",
+        FRESHRSS_USERNAME="testuser",
+        FRESHRSS_PASSWORD="testpass",
+        FRESHRSS_SID_CACHE=str(cache),
+    )
+    login = api.post("/accounts/ClientLogin").respond(200, content=b"SID=shared")
+
+    first = FreshRSSClient(config)
+    await first._ensure_authenticated()
+    assert cache.read_text() == "shared"
+    assert cache.stat().st_mode & 0o777 == 0o600
+
+    second = FreshRSSClient(config)
+    await second._ensure_authenticated()
+    assert second._auth_token == "shared"
+    assert login.call_count == 1
+
+    second._drop_cached_sid("shared")
+    assert not cache.exists()
+
+
 async def test_get_auth_headers_unauthenticated(client):
     """Calling _get_auth_headers before authenticate raises."""
     with pytest.raises(AuthenticationError, match="Not authenticated"):
         client._get_auth_headers()
 
 
+def test_auth_headers_cached_per_token(client):
+    client._auth_token = "one"
+    headers = client._get_auth_headers()
+    assert headers == {"Authorization": "GoogleLogin auth=one"}
+    assert client._get_auth_headers() is headers
+
+    client._auth_token = "two"
+    assert client._get_auth_headers() == {"Authorization": "GoogleLogin auth=two"}
+
+
 # --- Feed Operations ---
 
 
-@pytest.mark.asyncio
-async def test_list_feeds(client):
+async def test_list_feeds(client, api):
     client._auth_token = "tok"
-    mock_response = MagicMock()
-    mock_response.json.return_value = {
-        "subscriptions": [
-            {"id": "feed/123", "title": "Feed A", "url": "https://a.com/rss"},
-            {"id": "feed/456", "title": "Feed B", "url": "https://b.com/rss"},
-        ]
-    }
-    mock_response.raise_for_status = MagicMock()
-
-    with patch.object(client._client, "get", new_callable=AsyncMock, return_value=mock_response):
-        feeds = await client.list_feeds()
+    route = api.get("/reader/api/0/subscription/list").respond(
+        json={
+            "subscriptions": [
+                {"id": "feed/123", "title": "Feed A", "url": "https://a.com/rss"},
+                {"id": "feed/456", "title": "Feed B", "url": "https://b.com/rss"},
+            ]
+        }
+    )
+
+    feeds = await client.list_feeds()
 
     assert len(feeds) == 2
     assert feeds[0].name == "Feed A"
     assert feeds[0].id == 123
     assert feeds[1].url == "https://b.com/rss"
+    request = route.calls.last.request
+    assert request.url.params["output"] == "json"
+    assert request.headers["Authorization"] == "GoogleLogin auth=tok"
 
 
-@pytest.mark.asyncio
-async def test_list_feeds_empty(client):
+async def test_list_feeds_empty(client, api):
     client._auth_token = "tok"
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"subscriptions": []}
-    mock_response.raise_for_status = MagicMock()
+    api.get("/reader/api/0/subscription/list").respond(json={"subscriptions": []})
 
-    with patch.object(client._client, "get", new_callable=AsyncMock, return_value=mock_response):
-        feeds = await client.list_feeds()
+    feeds = await client.list_feeds()
 
     assert feeds == []
 
 
-@pytest.mark.asyncio
-async def test_get_unread_counts(client):
+async def test_get_feed(client, api):
     client._auth_token = "tok"
-    mock_response = MagicMock()
-    mock_response.json.return_value = {
-        "unreadcounts": [
-            {"id": "feed/123", "count": 5},
-            {"id": "feed/456", "count": 3},
-        ]
-    }
-    mock_response.raise_for_status = MagicMock()
-
-    with patch.object(client._client, "get", new_callable=AsyncMock, return_value=mock_response):
-        counts = await client.get_unread_counts()
+    route = api.get("/reader/api/0/subscription/list").respond(
+        json={"subscriptions": [{"id": "feed/123", "title": "Feed A"}]}
+    )
+
+    feed = await client.get_feed(123)
+
+    assert feed is not None
+    assert feed.name == "Feed A"
+    assert await client.get_feed(999) is None
+    assert route.call_count == 1
+
+
+async def test_get_unread_counts(client, api):
+    client._auth_token = "tok"
+    api.get("/reader/api/0/unread-count").respond(
+        json={
+            "unreadcounts": [
+                {"id": "feed/123", "count": 5},
+                {"id": "feed/456", "count": 3},
+            ]
+        }
+    )
+
+    counts = await client.get_unread_counts()
 
     assert counts[123] == 5
     assert counts[456] == 3
 
 
+async def test_get_unread_counts_skips_missing_id(client, api):
+    client._auth_token = "tok"
+    api.get("/reader/api/0/unread-count").respond(
+        json={"unreadcounts": [{"id": "", "count": 9}, {"count": 4}, {"id": "feed/1", "count": 2}]}
+    )
+
+    assert await client.get_unread_counts() == {1: 2}
+
+
+async def test_list_feeds_and_counts_are_cached(client, api):
+    """Back-to-back calls within the TTL reuse the previous response."""
+    client._auth_token = "tok"
+    feeds_route = api.get("/reader/api/0/subscription/list").respond(
+        json={"subscriptions": [{"id": "feed/1", "title": "A"}]}
+    )
+    counts_route = api.get("/reader/api/0/unread-count").respond(
+        json={"unreadcounts": [{"id": "feed/1", "count": 4}]}
+    )
+
+    assert len(await client.list_feeds()) == 1
+    assert len(await client.list_feeds()) == 1
+    assert await client.get_unread_counts() == {1: 4}
+    assert await client.get_unread_counts() == {1: 4}
+
+    assert feeds_route.call_count == 1
+    assert counts_route.call_count == 1
+
+
+async def test_edit_tags_invalidates_unread_cache(client, api):
+    client._auth_token = "tok"
+    client._unread_cache = (float("inf"), {1: 4})
+    api.post("/reader/api/0/edit-tag").respond(200, text="OK")
+
+    await client.mark_as_read([100])
+
+    assert client._unread_cache is None
+
+
+async def test_unread_counts_fetched_across_an_edit_are_not_cached(client, api):
+    """Counts read before a concurrent edit landed must not outlive it."""
+    client._auth_token = "tok"
+    api.post("/reader/api/0/edit-tag").respond(200, text="OK")
+    release = asyncio.Event()
+
+    async def respond(request):
+        await release.wait()
+        return respx.MockResponse(200, json={"unreadcounts": [{"id": "feed/1", "count": 4}]})
+
+    api.get("/reader/api/0/unread-count").mock(side_effect=respond)
+
+    fetch = asyncio.ensure_future(client.get_unread_counts())
+    await asyncio.sleep(0)
+    await client.mark_as_read([100])
+    release.set()
+
+    assert await fetch == {1: 4}
+    assert client._unread_cache is None
+
+
+async def test_expired_session_reauthenticates_once(client, api):
+    """A 401 clears the stale SID, logs in again, and retries the request."""
+    client._auth_token = "stale"
+    route = api.get("/reader/api/0/subscription/list")
+    route.side_effect = [
+        respx.MockResponse(401),
+        respx.MockResponse(200, json={"subscriptions": []}),
+    ]
+    api.post("/accounts/ClientLogin").respond(200, content=b"SID=fresh")
+
+    feeds = await client.list_feeds()
+
+    assert feeds == []
+    assert client._auth_token == "fresh"
+    assert route.call_count == 2
+    assert route.calls.last.request.headers["Authorization"] == "GoogleLogin auth=fresh"
+
+
 # --- Article Operations ---
 
 SAMPLE_ITEM = {
@@ -143,109 +265,223 @@ SAMPLE_ITEM = {
     "categories": ["user/-/state/com.google/read"],
 }
 
+READING_LIST = "/reader/api/0/stream/contents/user/-/state/com.google/reading-list"
 
-@pytest.mark.asyncio
-async def test_get_articles(client):
+
+async def test_get_articles(client, api):
     client._auth_token = "tok"
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"items": [SAMPLE_ITEM]}
-    mock_response.raise_for_status = MagicMock()
+    route = api.get(READING_LIST).respond(json={"items": [SAMPLE_ITEM]})
 
-    with patch.object(client._client, "get", new_callable=AsyncMock, return_value=mock_response):
-        articles = await client.get_articles(limit=10)
+    articles = await client.get_articles(limit=10)
 
     assert len(articles) == 1
     assert articles[0].title == "Test Article"
     assert articles[0].is_read is True
     assert articles[0].is_starred is False
     assert articles[0].id == 1234567890
+    params = route.calls.last.request.url.params
+    assert params["n"] == "10"
+    assert params["xt"] == "user/-/state/com.google/read"
+
+
+@pytest.mark.parametrize(
+    "bad",
+    [
+        {**SAMPLE_ITEM, "title": None},
+        {**SAMPLE_ITEM, "published": "yesterday"},
+        {**SAMPLE_ITEM, "alternate": "https://example.com"},
+    ],
+)
+async def test_get_articles_skips_malformed_item(client, api, bad):
+    """One item that doesn't match the schema is dropped, not the whole page."""
+    client._auth_token = "tok"
+    other = {**SAMPLE_ITEM, "id": "tag:google.com,2005:reader/item/abc"}
+    api.get(READING_LIST).respond(json={"items": [SAMPLE_ITEM, bad, other]})
+
+    articles = await client.get_articles()
+
+    assert [a.id for a in articles] == [1234567890, 0xABC]
 
 
-@pytest.mark.asyncio
-async def test_get_articles_with_feed_filter(client):
+async def test_get_articles_with_feed_filter(client, api):
     client._auth_token = "tok"
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"items": [SAMPLE_ITEM]}
-    mock_response.raise_for_status = MagicMock()
+    route = api.get("/reader/api/0/stream/contents/feed/42").respond(json={"items": [SAMPLE_ITEM]})
 
-    mock_get = AsyncMock(return_value=mock_response)
-    with patch.object(client._client, "get", mock_get):
-        await client.get_articles(feed_id=42, limit=5)
+    await client.get_articles(feed_id=42, limit=5)
 
-    call_url = mock_get.call_args[0][0]
-    assert "feed/42" in call_url
+    assert route.called
 
 
-@pytest.mark.asyncio
-async def test_get_articles_empty_response(client):
+async def test_get_articles_empty_response(client, api):
     client._auth_token = "tok"
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"items": []}
-    mock_response.raise_for_status = MagicMock()
+    api.get(READING_LIST).respond(json={"items": []})
 
-    with patch.object(client._client, "get", new_callable=AsyncMock, return_value=mock_response):
-        articles = await client.get_articles()
+    articles = await client.get_articles()
 
     assert articles == []
 
 
+async def test_get_overview(client, api):
+    client._auth_token = "tok"
+    api.get("/reader/api/0/subscription/list").respond(
+        json={"subscriptions": [{"id": "feed/1", "title": "A"}]}
+    )
+    api.get("/reader/api/0/unread-count").respond(
+        json={"unreadcounts": [{"id": "feed/1", "count": 2}]}
+    )
+    api.get(READING_LIST).respond(json={"items": [SAMPLE_ITEM]})
+
+    feeds, counts, articles = await client.get_overview(limit=5)
+
+    assert [f.name for f in feeds] == ["A"]
+    assert counts == {1: 2}
+    assert articles[0].title == "Test Article"
+
+
 # --- Tag Operations ---
 
 
-@pytest.mark.asyncio
-async def test_mark_as_read(client):
+@pytest.fixture
+def edit_tag(api):
+    return api.post("/reader/api/0/edit-tag").respond(200, text="OK")
+
+
+async def test_mark_as_read(client, edit_tag):
     client._auth_token = "tok"
-    mock_response = MagicMock()
-    mock_response.raise_for_status = MagicMock()
 
-    mock_post = AsyncMock(return_value=mock_response)
-    with patch.object(client._client, "post", mock_post):
-        result = await client.mark_as_read([100, 200])
+    result = await client.mark_as_read([100, 200])
 
     assert result is True
-    call_data = mock_post.call_args[1]["data"]
-    assert "user/-/state/com.google/read" in call_data["a"]
+    request = edit_tag.calls.last.request
+    assert request.content == (
+        b"i=tag%3Agoogle.com%2C2005%3Areader%2Fitem%2F100"
+        b"&i=tag%3Agoogle.com%2C2005%3Areader%2Fitem%2F200"
+        b"&a=user%2F-%2Fstate%2Fcom.google%2Fread"
+    )
+    assert request.headers["Content-Type"] == "application/x-www-form-urlencoded"
 
 
-@pytest.mark.asyncio
-async def test_mark_as_unread(client):
+async def test_mark_as_read_coalesces_concurrent_calls(client, edit_tag):
     client._auth_token = "tok"
-    mock_response = MagicMock()
-    mock_response.raise_for_status = MagicMock()
 
-    mock_post = AsyncMock(return_value=mock_response)
-    with patch.object(client._client, "post", mock_post):
-        result = await client.mark_as_unread([100])
+    results = await asyncio.gather(client.mark_as_read([1]), client.mark_as_read([2, 3]))
+
+    assert results == [True, True]
+    assert edit_tag.call_count == 1
+    assert edit_tag.calls.last.request.content.count(b"i=") == 3
+
+
+async def test_mark_as_read_sequential_calls_post_immediately(client, edit_tag):
+    client._auth_token = "tok"
+
+    await client.mark_as_read([1])
+    assert edit_tag.call_count == 1
+    await client.mark_as_read([2])
+    assert edit_tag.call_count == 2
+
+
+def _held_edit_tag(api):
+    """Route edit-tag so the first POST blocks until the returned event is set."""
+    release = asyncio.Event()
+    bodies = []
+
+    async def respond(request):
+        bodies.append(request.content)
+        if len(bodies) == 1:
+            await release.wait()
+        return respx.MockResponse(200, text="OK")
+
+    api.post("/reader/api/0/edit-tag").mock(side_effect=respond)
+    return release, bodies
+
+
+async def test_mark_as_read_queues_behind_inflight_post(client, api):
+    client._auth_token = "tok"
+    release, bodies = _held_edit_tag(api)
+
+    first = asyncio.ensure_future(client.mark_as_read([1]))
+    while not bodies:
+        await asyncio.sleep(0)
+    later = asyncio.gather(client.mark_as_read([2]), client.mark_as_read([3]))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first is True
+    assert await later == [True, True]
+    assert [body.count(b"i=") for body in bodies] == [1, 2]
+
+
+async def test_mark_as_unread_waits_for_inflight_read(client, api):
+    client._auth_token = "tok"
+    release, bodies = _held_edit_tag(api)
+
+    read = asyncio.ensure_future(client.mark_as_read([7]))
+    while not bodies:
+        await asyncio.sleep(0)
+    unread = asyncio.ensure_future(client.mark_as_unread([7]))
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert len(bodies) == 1
+    release.set()
+
+    assert await read is True
+    assert await unread is True
+    assert [b"&a=" in body for body in bodies] == [True, False]
+
+
+async def test_edit_tags_splits_large_batches(client, edit_tag):
+    client._auth_token = "tok"
+    client._mark_chunk_size = 2
+
+    await client.mark_as_unread([1, 2, 3, 4, 5])
+
+    bodies = [call.request.content for call in edit_tag.calls]
+    assert sorted(body.count(b"i=") for body in bodies) == [1, 2, 2]
+    assert all(body.endswith(b"&r=user%2F-%2Fstate%2Fcom.google%2Fread") for body in bodies)
+
+
+async def test_mark_as_unread_cancels_pending_read(client, edit_tag):
+    client._auth_token = "tok"
+
+    pending = asyncio.ensure_future(client.mark_as_read([7]))
+    await asyncio.sleep(0)
+    await client.mark_as_unread([7])
+    assert await pending is True
+
+    assert edit_tag.call_count == 1
+    assert b"&r=" in edit_tag.calls.last.request.content
+
+
+async def test_mark_as_unread(client, edit_tag):
+    client._auth_token = "tok"
+
+    result = await client.mark_as_unread([100])
 
     assert result is True
-    call_data = mock_post.call_args[1]["data"]
-    assert "user/-/state/com.google/read" in call_data["r"]
+    body = edit_tag.calls.last.request.content
+    assert body.endswith(b"&r=user%2F-%2Fstate%2Fcom.google%2Fread")
 
 
-@pytest.mark.asyncio
-async def test_star_article(client):
+async def test_star_article(client, edit_tag):
     client._auth_token = "tok"
-    mock_response = MagicMock()
-    mock_response.raise_for_status = MagicMock()
 
-    mock_post = AsyncMock(return_value=mock_response)
-    with patch.object(client._client, "post", mock_post):
-        result = await client.star_article(999)
+    result = await client.star_article(999)
 
     assert result is True
+    assert edit_tag.calls.last.request.content.endswith(
+        b"&a=user%2F-%2Fstate%2Fcom.google%2Fstarred"
+    )
 
 
-@pytest.mark.asyncio
-async def test_unstar_article(client):
+async def test_unstar_article(client, edit_tag):
     client._auth_token = "tok"
-    mock_response = MagicMock()
-    mock_response.raise_for_status = MagicMock()
 
-    mock_post = AsyncMock(return_value=mock_response)
-    with patch.object(client._client, "post", mock_post):
-        result = await client.unstar_article(999)
+    result = await client.unstar_article(999)
 
     assert result is True
+    assert edit_tag.calls.last.request.content.endswith(
+        b"&r=user%2F-%2Fstate%2Fcom.google%2Fstarred"
+    )
 
 
 # --- ID Extraction ---
@@ -253,40 +489,48 @@ async def test_unstar_article(client):
 
 class TestExtractFeedId:
     def test_numeric_with_prefix(self):
-        assert FreshRSSClient._extract_feed_id("feed/123") == 123
+        assert _extract_feed_id("feed/123") == 123
 
     def test_numeric_without_prefix(self):
-        assert FreshRSSClient._extract_feed_id("456") == 456
+        assert _extract_feed_id("456") == 456
+
+    def test_negative_numeric(self):
+        assert _extract_feed_id("feed/-1") == -1
+        assert _extract_feed_id("-42") == -42
 
     def test_url_string_falls_back_to_hash(self):
-        result = FreshRSSClient._extract_feed_id("feed/https://example.com/rss")
+        result = _extract_feed_id("feed/https://example.com/rss")
         assert isinstance(result, int)
-        assert 0 <= result < 1_000_000
+        assert 0 <= result < 2**64
+
+    def test_hash_fallback_is_deterministic(self):
+        """Fallback IDs must not depend on PYTHONHASHSEED."""
+        result = _extract_feed_id("feed/https://example.com/rss")
+        assert result == 0x258A7F0D1D16B328
 
     def test_empty_string(self):
-        result = FreshRSSClient._extract_feed_id("")
-        assert isinstance(result, int)
+        assert _extract_feed_id("") == 0
+        assert _extract_feed_id("feed/") == 0
 
 
 class TestExtractArticleId:
     def test_decimal_id(self):
-        assert (
-            FreshRSSClient._extract_article_id("tag:google.com,2005:reader/item/1234567890")
-            == 1234567890
-        )
+        assert _extract_article_id("tag:google.com,2005:reader/item/1234567890") == 1234567890
 
     def test_hex_id(self):
-        result = FreshRSSClient._extract_article_id(
-            "tag:google.com,2005:reader/item/00000186a7b3c4d5"
-        )
+        result = _extract_article_id("tag:google.com,2005:reader/item/00000186a7b3c4d5")
         assert result == 0x00000186A7B3C4D5
 
+    def test_non_hex_item_falls_back_to_hash(self):
+        item_id = "tag:google.com,2005:reader/item/not-hex"
+        assert _extract_article_id(item_id) == _stable_id(item_id)
+
     def test_non_numeric_falls_back_to_hash(self):
-        result = FreshRSSClient._extract_article_id("some-random-string")
+        result = _extract_article_id("some-random-string")
         assert isinstance(result, int)
 
     def test_empty_string(self):
-        result = FreshRSSClient._extract_article_id("")
+        result = _extract_article_id("")
         assert isinstance(result, int)
 
 
@@ -303,7 +547,7 @@ class TestParseArticle:
             "origin": {"title": "Feed"},
             "categories": [],
         }
-        article = client._parse_article(item)
+        article = client._parse_article(msgspec.convert(item, RawItem))
         assert article is not None
         assert article.summary == ""
 
@@ -317,7 +561,7 @@ class TestParseArticle:
             "origin": {"title": "Feed"},
             "categories": [],
         }
-        article = client._parse_article(item)
+        article = client._parse_article(msgspec.convert(item, RawItem))
         assert article is not None
         assert article.url == ""
 
@@ -331,24 +575,42 @@ class TestParseArticle:
             "origin": {"title": "Feed"},
             "categories": ["user/-/state/com.google/starred"],
         }
-        article = client._parse_article(item)
+        article = client._parse_article(msgspec.convert(item, RawItem))
         assert article is not None
         assert article.is_starred is True
         assert article.is_read is False
 
     def test_malformed_item_still_parses(self, client):
         """Minimal/garbage data produces an Article with safe defaults."""
-        article = client._parse_article({"garbage": True})
+        article = client._parse_article(msgspec.convert({"garbage": True}, RawItem))
         assert article is not None
         assert article.title == "Untitled"
         assert article.summary == ""
         assert article.url == ""
 
+    def test_null_summary_and_origin(self, client):
+        """Explicit nulls decode to the same defaults as missing keys."""
+        item = {"id": "tag:google.com,2005:reader/item/1", "summary": None, "origin": None}
+        article = client._parse_article(msgspec.convert(item, RawItem))
+        assert article.summary == ""
+        assert article.feed_name == "Unknown Feed"
+
+    def test_feed_name_shared_across_articles(self, client):
+        items = [{"origin": {"title": "".join(["Ars ", "Technica"])}} for _ in range(2)]
+        first, second = (client._parse_article(msgspec.convert(i, RawItem)) for i in items)
+        assert first.feed_name == "Ars Technica"
+        assert first.feed_name is second.feed_name
+
 
 # --- Lifecycle ---
 
 
-@pytest.mark.asyncio
 async def test_aclose(client):
     await client.aclose()
     assert client._client.is_closed
+
+
+async def test_async_context_manager_closes(config):
+    async with FreshRSSClient(config) as client:
+        assert not client._client.is_closed
+    assert client._client.is_closed
@@ -11,7 +11,7 @@ from freshrss_mcp.config import Config, load_config
 def _clean_env(monkeypatch):
     """Remove all FRESHRSS/MCP env vars before each test."""
     for key in list(os.environ):
-        if key.startswith(("FRESHRSS_", "MCP_SERVER_")):
+        if key.startswith(("FRESHRSS_", "MCP_")):
             monkeypatch.delenv(key, raising=False)
 
 
@@ -53,6 +53,9 @@ def test_defaults(monkeypatch):
     assert config.freshrss_api_path == "/api/greader.php"
     assert config.server_host == "127.0.0.1"
     assert config.server_port == 8000
+    assert config.freshrss_sid_cache is None
+    assert config.max_concurrent_feeds == 8
+    assert config.mark_chunk_size == 250
 
 
 def test_custom_port_and_host(monkeypatch):
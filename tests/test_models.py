@@ -1,5 +1,9 @@
 """Tests for models.py — data model serialization and construction."""
 
+import pickle
+
+import pytest
+
 from freshrss_mcp.models import Article, Feed
 
 
@@ -73,28 +77,68 @@ class TestArticle:
         )
         assert article.to_dict()["summary"] == ""
 
+    def test_no_instance_dict(self):
+        """Articles are slotted structs, not per-instance dicts."""
+        article = Article(
+            id=1,
+            title="T",
+            summary="S",
+            url="U",
+            published=0,
+            feed_name="F",
+            is_read=False,
+            is_starred=False,
+        )
+        assert not hasattr(article, "__dict__")
+
+    def test_immutable(self):
+        article = Article(
+            id=1,
+            title="T",
+            summary="S",
+            url="U",
+            published=0,
+            feed_name="F",
+            is_read=False,
+            is_starred=False,
+        )
+        with pytest.raises(AttributeError):
+            article.title = "changed"
+
+    def test_pickle_round_trip(self):
+        article = Article(
+            id=7,
+            title="Title",
+            summary="Summary",
+            url="U",
+            published=1,
+            feed_name="F",
+            is_read=True,
+            is_starred=False,
+        )
+        assert pickle.loads(pickle.dumps(article)) == article
+
+    def test_struct_fields_match_serialized_fields(self):
+        """No derived or hidden fields ride along in repr, ==, or msgspec encoding."""
+        assert Article.__struct_fields__ == Article._FIELDS
+
 
 class TestFeed:
-    def test_construction_with_defaults(self):
+    def test_construction(self):
         feed = Feed(id=10, name="My Feed", url="https://example.com/feed")
-        assert feed.unread_count == 0
-
-    def test_construction_with_unread(self):
-        feed = Feed(id=10, name="My Feed", url="https://example.com/feed", unread_count=42)
-        assert feed.unread_count == 42
+        assert feed.id == 10
+        assert feed.name == "My Feed"
 
     def test_to_dict(self):
-        feed = Feed(id=5, name="News", url="https://news.com/rss", unread_count=3)
+        feed = Feed(id=5, name="News", url="https://news.com/rss")
         d = feed.to_dict()
-        assert d == {
-            "id": 5,
-            "name": "News",
-            "url": "https://news.com/rss",
-            "unread_count": 3,
-        }
+        assert d == {"id": 5, "name": "News", "url": "https://news.com/rss"}
 
-    def test_mutable_unread_count(self):
-        """Tools mutate unread_count after construction — verify this works."""
+    def test_frozen(self):
+        """Cached Feeds are shared between callers, so they can't be mutated."""
         feed = Feed(id=1, name="F", url="U")
-        feed.unread_count = 99
-        assert feed.to_dict()["unread_count"] == 99
+        with pytest.raises(AttributeError):
+            feed.name = "G"
+
+    def test_struct_fields_match_serialized_fields(self):
+        assert Feed.__struct_fields__ == Feed._FIELDS
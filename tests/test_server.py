@@ -0,0 +1,112 @@
+"""End-to-end shutdown test for the MCP server process."""
+
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from fastmcp import Client
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+class _FreshRSSStub(BaseHTTPRequestHandler):
+    """Minimal keep-alive Google Reader API so the server's pool stays warm."""
+
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self, body: bytes) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._reply(b"SID=test-sid\nAuth=test-sid\n")
+
+    def do_GET(self) -> None:
+        if "subscription/list" in self.path:
+            body = {"subscriptions": [{"id": "feed/1", "title": "Feed", "url": "http://x"}]}
+        else:
+            body = {"unreadcounts": [{"id": "feed/1", "count": 3}]}
+        self._reply(json.dumps(body).encode())
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def freshrss_stub() -> Iterator[str]:
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _FreshRSSStub)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def server(freshrss_stub: str) -> Iterator[tuple[subprocess.Popen[str], str]]:
+    port = _free_port()
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(SRC),
+        "FRESHRSS_URL": freshrss_stub,
+        "FRESHRSS_USERNAME": "user",
+        "FRESHRSS_PASSWORD": "pass",
+        "MCP_SERVER_PORT": str(port),
+    }
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "freshrss_mcp.server"],
+        env=env,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            break
+        except OSError:
+            if proc.poll() is not None:
+                break
+            time.sleep(0.05)
+    try:
+        yield proc, f"http://127.0.0.1:{port}/mcp"
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+
+
+@pytest.mark.parametrize("signum", [signal.SIGTERM, signal.SIGINT])
+async def test_signal_with_warm_pool_exits_cleanly(
+    server: tuple[subprocess.Popen[str], str], signum: signal.Signals
+) -> None:
+    proc, url = server
+    async with Client(url) as mcp:
+        result = await mcp.call_tool("list_feeds", {})
+    assert json.loads(result.content[0].text) == [
+        {"id": 1, "name": "Feed", "url": "http://x", "unread_count": 3}
+    ]
+
+    proc.send_signal(signum)
+    _, stderr = proc.communicate(timeout=15)
+    assert "Traceback" not in stderr, stderr
+    assert proc.returncode == 0
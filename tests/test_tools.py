@@ -6,12 +6,14 @@ These tests verify that:
 3. The _truncate_summary helper works at boundaries
 """
 
+import asyncio
+from collections import namedtuple
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
+import orjson
 import pytest
 
-from freshrss_mcp.client import FreshRSSClient
-from freshrss_mcp.config import Config
 from freshrss_mcp.models import Article, Feed
 from freshrss_mcp.tools import _truncate_summary, register_tools
 
@@ -26,35 +28,72 @@ class FakeMCP:
         self.tools: dict[str, object] = {}
 
     def tool(self):
-        def decorator(fn):
-            self.tools[fn.__name__] = fn
-            return fn
+        return self._register
 
-        return decorator
+    def _register(self, fn):
+        self.tools[fn.__name__] = fn
+        return fn
 
 
-@pytest.fixture
-def config():
-    return Config(
-        FRESHRSS_URL="https://test.freshrss.com",
-        FRESHRSS_USERNAME="testuser",
-        FRESHRSS_PASSWORD="testpass",
-    )
+def _returns(value):
+    """Cheap async stand-in for AsyncMock(return_value=value)."""
 
+    async def stub(*args, **kwargs):
+        return value
 
-@pytest.fixture
-def mock_client(config):
-    client = FreshRSSClient(config)
-    client._auth_token = "test-token"
-    return client
+    return stub
+
+
+def _raises(exc):
+    """Cheap async stand-in for AsyncMock(side_effect=exc)."""
+
+    async def stub(*args, **kwargs):
+        raise exc
+
+    return stub
+
+
+# Client methods the tools call; each test assigns the coroutines it needs.
+CLIENT_METHODS = (
+    "get_articles",
+    "list_feeds",
+    "get_feed",
+    "get_unread_counts",
+    "mark_as_read",
+    "mark_as_unread",
+    "star_article",
+    "unstar_article",
+)
+
+
+@pytest.fixture(scope="module")
+def shared_client():
+    """Client stand-in shared by the module; no httpx pool is created."""
+    return SimpleNamespace()
 
 
 @pytest.fixture
-def tools(mock_client):
-    """Register tools on a fake MCP and return them as a dict."""
+def mock_client(shared_client):
+    """The shared stand-in, with every method reset before each test."""
+    shared_client.__dict__.update(dict.fromkeys(CLIENT_METHODS))
+    return shared_client
+
+
+@pytest.fixture(scope="module")
+def shared_tools(shared_client):
+    # The tool closures look methods up on the client at call time, so one
+    # registration serves every test in the module.
     fake_mcp = FakeMCP()
-    register_tools(fake_mcp, mock_client)
-    return fake_mcp.tools
+    register_tools(fake_mcp, shared_client)
+    # Exposed as read-only attributes, e.g. tools.list_feeds(), so a test
+    # cannot swap out a tool for the rest of the module.
+    return namedtuple("Tools", fake_mcp.tools)(**fake_mcp.tools)
+
+
+@pytest.fixture
+def tools(shared_tools, mock_client):
+    """Registered tools, bound to a freshly reset mock_client."""
+    return shared_tools
 
 
 # --- _truncate_summary ---
@@ -74,6 +113,9 @@ class TestTruncateSummary:
         assert result.endswith("...")
         assert len(result) <= 18  # 15 + "..."
 
+    def test_no_space_cuts_at_max_length(self):
+        assert _truncate_summary("abcdefghij", 4) == "abcd..."
+
     def test_empty_string(self):
         assert _truncate_summary("", 100) == ""
 
@@ -81,11 +123,26 @@ class TestTruncateSummary:
         result = _truncate_summary("hello world", 0)
         assert result.endswith("...")
 
+    @pytest.mark.parametrize(
+        ("text", "max_length", "expected"),
+        [
+            ("hello world this is a test", 15, "hello world..."),
+            ("hello world this is a test", 11, "hello..."),
+            ("hello world this is a test", 12, "hello world..."),
+            ("hello  world", 7, "hello ..."),
+            (" leading", 5, "..."),
+            ("Grüße aus Köln", 10, "Grüße aus..."),
+        ],
+    )
+    def test_exact_output(self, text, max_length, expected):
+        """Unlike textwrap.shorten, whitespace is kept and "..." is not counted."""
+        assert _truncate_summary(text, max_length) == expected
+
 
 # --- Tool Error Boundaries ---
 
 
-SAMPLE_ARTICLES = [
+SAMPLE_ARTICLES: tuple[Article, ...] = (
     Article(
         id=1,
         title="Art 1",
@@ -106,169 +163,238 @@ SAMPLE_ARTICLES = [
         is_read=True,
         is_starred=True,
     ),
-]
-
-SAMPLE_FEEDS = [
-    Feed(id=10, name="Feed A", url="https://a.com/rss"),
-    Feed(id=20, name="Feed B", url="https://b.com/rss"),
-]
-
-
-@pytest.mark.asyncio
-async def test_get_unread_articles_happy_path(tools, mock_client):
-    mock_client.get_articles = AsyncMock(return_value=SAMPLE_ARTICLES)
+)
 
-    result = await tools["get_unread_articles"]()
-    assert "Art 1" in result
-    assert "Art 2" in result
+# Single-article responses, built once rather than per test.
+FIRST_ARTICLE = (SAMPLE_ARTICLES[0],)
+SECOND_ARTICLE = (SAMPLE_ARTICLES[1],)
 
 
-@pytest.mark.asyncio
-async def test_get_unread_articles_error_returns_string(tools, mock_client):
-    mock_client.get_articles = AsyncMock(side_effect=RuntimeError("connection lost"))
+def sample_feeds() -> list[Feed]:
+    """Fresh Feed objects per call; Feed is mutable, so none are shared between tests."""
+    return [
+        Feed(id=10, name="Feed A", url="https://a.com/rss"),
+        Feed(id=20, name="Feed B", url="https://b.com/rss"),
+    ]
 
-    result = await tools["get_unread_articles"]()
-    assert result.startswith("Error:")
-    assert "connection lost" in result
 
+async def test_get_unread_articles_returns_json(tools, mock_client):
+    mock_client.get_articles = _returns(SAMPLE_ARTICLES)
 
-@pytest.mark.asyncio
-async def test_list_feeds_happy_path(tools, mock_client):
-    mock_client.list_feeds = AsyncMock(return_value=SAMPLE_FEEDS)
-    mock_client.get_unread_counts = AsyncMock(return_value={10: 5, 20: 0})
+    result = orjson.loads(await tools.get_unread_articles())
+    assert [a["title"] for a in result] == ["Art 1", "Art 2"]
+    assert result[1]["is_starred"] is True
 
-    result = await tools["list_feeds"]()
-    assert "Feed A" in result
-    assert "Feed B" in result
 
+async def test_get_unread_articles_multiple_feeds(tools, mock_client):
+    """Per-feed results are merged and ordered newest first."""
+    mock_client.get_articles = AsyncMock(side_effect=[FIRST_ARTICLE, SECOND_ARTICLE])
 
-@pytest.mark.asyncio
-async def test_list_feeds_error_returns_string(tools, mock_client):
-    mock_client.list_feeds = AsyncMock(side_effect=RuntimeError("timeout"))
+    result = orjson.loads(await tools.get_unread_articles(feed_ids=[10, 20]))
+    assert mock_client.get_articles.await_count == 2
+    assert [a["id"] for a in result] == [2, 1]
 
-    result = await tools["list_feeds"]()
-    assert result.startswith("Error:")
 
+def _articles(feed_id, *published):
+    return [
+        Article(
+            id=feed_id * 1000 + i,
+            title=f"{feed_id}-{i}",
+            summary="",
+            url="",
+            published=ts,
+            feed_name=str(feed_id),
+            is_read=False,
+            is_starred=False,
+        )
+        for i, ts in enumerate(published)
+    ]
 
-@pytest.mark.asyncio
-async def test_get_feed_info_found(tools, mock_client):
-    mock_client.list_feeds = AsyncMock(return_value=SAMPLE_FEEDS)
-    mock_client.get_unread_counts = AsyncMock(return_value={10: 3})
 
-    result = await tools["get_feed_info"](feed_id=10)
-    assert "Feed A" in result
+async def test_get_unread_articles_fetches_share_per_feed(tools, mock_client):
+    mock_client.get_articles = AsyncMock(return_value=[])
 
+    await tools.get_unread_articles(limit=40, feed_ids=[1, 2, 3, 4])
+    assert {c.kwargs["limit"] for c in mock_client.get_articles.await_args_list} == {15}
 
-@pytest.mark.asyncio
-async def test_get_feed_info_not_found(tools, mock_client):
-    mock_client.list_feeds = AsyncMock(return_value=SAMPLE_FEEDS)
-    mock_client.get_unread_counts = AsyncMock(return_value={})
 
-    result = await tools["get_feed_info"](feed_id=999)
-    assert "Error:" in result
-    assert "999" in result
+async def test_get_unread_articles_refetches_feed_that_filled_its_share(tools, mock_client):
+    """A feed that filled its first allotment is re-fetched with a larger one."""
+    busy = _articles(1, *range(100, 80, -1))
+    quiet = _articles(2, 10, 9)
 
+    async def get_articles(feed_id, limit, **kwargs):
+        return busy[:limit] if feed_id == 1 else quiet
 
-@pytest.mark.asyncio
-async def test_search_articles_matches(tools, mock_client):
-    mock_client.get_articles = AsyncMock(return_value=SAMPLE_ARTICLES)
+    mock_client.get_articles = AsyncMock(side_effect=get_articles)
 
-    result = await tools["search_articles"](query="Art 1")
-    assert "Art 1" in result
-    assert "Art 2" not in result
+    result = orjson.loads(await tools.get_unread_articles(limit=20, feed_ids=[1, 2]))
+    assert [a["published"] for a in result] == list(range(100, 80, -1))
+    calls = mock_client.get_articles.await_args_list
+    assert [(c.kwargs["feed_id"], c.kwargs["limit"]) for c in calls] == [(1, 15), (2, 15), (1, 20)]
 
 
-@pytest.mark.asyncio
-async def test_search_articles_no_match(tools, mock_client):
+async def test_get_unread_articles_deduplicates(tools, mock_client):
     mock_client.get_articles = AsyncMock(return_value=SAMPLE_ARTICLES)
 
-    result = await tools["search_articles"](query="nonexistent")
-    assert result == "[]"
+    result = orjson.loads(await tools.get_unread_articles(feed_ids=[10, 20, 10]))
+    assert mock_client.get_articles.await_count == 2
+    assert [a["id"] for a in result] == [2, 1]
 
 
-@pytest.mark.asyncio
-async def test_search_articles_error(tools, mock_client):
-    mock_client.get_articles = AsyncMock(side_effect=RuntimeError("fail"))
+async def test_get_unread_articles_skips_failed_feed(tools, mock_client):
+    """One failing feed is dropped; the rest are still returned."""
+    mock_client.get_articles = AsyncMock(side_effect=[RuntimeError("down"), SECOND_ARTICLE])
 
-    result = await tools["search_articles"](query="test")
-    assert result.startswith("Error:")
+    result = orjson.loads(await tools.get_unread_articles(feed_ids=[10, 20]))
+    assert [a["title"] for a in result] == ["Art 2"]
 
 
-@pytest.mark.asyncio
-async def test_mark_as_read_empty_list(tools, mock_client):
-    result = await tools["mark_as_read"](article_ids=[])
-    assert result == "OK"
+async def test_get_unread_articles_caps_concurrent_feeds(mock_client):
+    fake_mcp = FakeMCP()
+    register_tools(fake_mcp, mock_client, max_concurrent_feeds=2)
+    in_flight = peak = 0
 
+    async def get_articles(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return []
 
-@pytest.mark.asyncio
-async def test_mark_as_read_success(tools, mock_client):
-    mock_client.mark_as_read = AsyncMock(return_value=True)
+    mock_client.get_articles = get_articles
+    await fake_mcp.tools["get_unread_articles"](feed_ids=[1, 2, 3, 4, 5])
+    assert peak == 2
 
-    result = await tools["mark_as_read"](article_ids=[1, 2, 3])
-    assert result == "OK"
 
+async def test_get_unread_articles_all_feeds_fail(tools, mock_client):
+    mock_client.get_articles = _raises(RuntimeError("down"))
 
-@pytest.mark.asyncio
-async def test_mark_as_read_error(tools, mock_client):
-    mock_client.mark_as_read = AsyncMock(side_effect=RuntimeError("server error"))
+    result = await tools.get_unread_articles(feed_ids=[10, 20])
+    assert result == "Error: down"
 
-    result = await tools["mark_as_read"](article_ids=[1])
-    assert result.startswith("Error:")
 
+async def test_get_feed_info_found(tools, mock_client):
+    feed = sample_feeds()[0]
+    mock_client.get_feed = _returns(feed)
+    mock_client.get_unread_counts = _returns({10: 3})
 
-@pytest.mark.asyncio
-async def test_mark_as_unread_success(tools, mock_client):
-    mock_client.mark_as_unread = AsyncMock(return_value=True)
+    result = orjson.loads(await tools.get_feed_info(feed_id=10))
+    assert result == {"id": 10, "name": "Feed A", "url": "https://a.com/rss", "unread_count": 3}
+    assert feed == sample_feeds()[0]
 
-    result = await tools["mark_as_unread"](article_ids=[1])
-    assert result == "OK"
 
+async def test_get_feed_info_not_found(tools, mock_client):
+    mock_client.get_feed = _returns(None)
+    mock_client.get_unread_counts = _returns({})
 
-@pytest.mark.asyncio
-async def test_star_article_success(tools, mock_client):
-    mock_client.star_article = AsyncMock(return_value=True)
+    result = await tools.get_feed_info(feed_id=999)
+    assert result == "Error: Feed 999 not found"
 
-    result = await tools["star_article"](article_id=42)
-    assert result == "OK"
 
+async def test_search_articles_matches(tools, mock_client):
+    mock_client.get_articles = _returns(SAMPLE_ARTICLES)
 
-@pytest.mark.asyncio
-async def test_star_article_error(tools, mock_client):
-    mock_client.star_article = AsyncMock(side_effect=RuntimeError("denied"))
+    result = orjson.loads(await tools.search_articles(query="Art 1"))
+    assert result == [SAMPLE_ARTICLES[0].to_dict()]
 
-    result = await tools["star_article"](article_id=42)
-    assert result.startswith("Error:")
 
+async def test_search_articles_is_case_insensitive(tools, mock_client):
+    mock_client.get_articles = _returns(SAMPLE_ARTICLES)
 
-@pytest.mark.asyncio
-async def test_unstar_article_success(tools, mock_client):
-    mock_client.unstar_article = AsyncMock(return_value=True)
+    result = orjson.loads(await tools.search_articles(query="SUMMARY TWO"))
+    assert [a["id"] for a in result] == [2]
 
-    result = await tools["unstar_article"](article_id=42)
-    assert result == "OK"
 
+async def test_search_articles_respects_limit(tools, mock_client):
+    mock_client.get_articles = _returns(SAMPLE_ARTICLES)
 
-@pytest.mark.asyncio
-async def test_get_feed_stats_happy(tools, mock_client):
-    mock_client.list_feeds = AsyncMock(return_value=SAMPLE_FEEDS)
-    mock_client.get_unread_counts = AsyncMock(return_value={10: 7, 20: 2})
+    result = orjson.loads(await tools.search_articles(query="summary", limit=1))
+    assert [a["title"] for a in result] == ["Art 1"]
 
-    result = await tools["get_feed_stats"]()
-    assert "Feed A" in result
-    assert "7" in result
 
+async def test_search_articles_no_match(tools, mock_client):
+    mock_client.get_articles = _returns(SAMPLE_ARTICLES)
 
-@pytest.mark.asyncio
-async def test_get_articles_by_feed_success(tools, mock_client):
-    mock_client.get_articles = AsyncMock(return_value=[SAMPLE_ARTICLES[0]])
+    result = await tools.search_articles(query="nonexistent")
+    assert result == "[]"
 
-    result = await tools["get_articles_by_feed"](feed_id=10)
-    assert "Art 1" in result
 
+async def test_mark_as_read_empty_list(tools, mock_client):
+    result = await tools.mark_as_read(article_ids=[])
+    assert result == "OK"
 
-@pytest.mark.asyncio
-async def test_get_articles_by_feed_error(tools, mock_client):
-    mock_client.get_articles = AsyncMock(side_effect=RuntimeError("boom"))
 
-    result = await tools["get_articles_by_feed"](feed_id=10)
-    assert result.startswith("Error:")
+@pytest.mark.parametrize(
+    ("tool", "kwargs", "expected"),
+    [
+        ("get_unread_articles", {}, [a.to_dict() for a in SAMPLE_ARTICLES]),
+        ("get_articles_by_feed", {"feed_id": 10}, [a.to_dict() for a in SAMPLE_ARTICLES]),
+        (
+            "list_feeds",
+            {},
+            [
+                {"id": 10, "name": "Feed A", "url": "https://a.com/rss", "unread_count": 7},
+                {"id": 20, "name": "Feed B", "url": "https://b.com/rss", "unread_count": 2},
+            ],
+        ),
+        (
+            "get_feed_stats",
+            {},
+            [
+                {"feed_id": 10, "feed_name": "Feed A", "unread_count": 7},
+                {"feed_id": 20, "feed_name": "Feed B", "unread_count": 2},
+            ],
+        ),
+    ],
+)
+async def test_read_tool_happy_path(tools, mock_client, tool, kwargs, expected):
+    mock_client.get_articles = _returns(SAMPLE_ARTICLES)
+    feeds = sample_feeds()
+    mock_client.list_feeds = _returns(feeds)
+    mock_client.get_unread_counts = _returns({10: 7, 20: 2})
+
+    result = await getattr(tools, tool)(**kwargs)
+    assert orjson.loads(result) == expected
+    # The client's cached Feeds must not pick up the counts.
+    assert feeds == sample_feeds()
+
+
+@pytest.mark.parametrize(
+    ("tool", "method", "kwargs"),
+    [
+        ("get_unread_articles", "get_articles", {}),
+        ("get_articles_by_feed", "get_articles", {"feed_id": 10}),
+        ("search_articles", "get_articles", {"query": "test"}),
+        ("list_feeds", "list_feeds", {}),
+        ("get_feed_info", "get_feed", {"feed_id": 10}),
+        ("get_feed_stats", "list_feeds", {}),
+        ("mark_as_read", "mark_as_read", {"article_ids": [1]}),
+        ("mark_as_unread", "mark_as_unread", {"article_ids": [1]}),
+        ("star_article", "star_article", {"article_id": 42}),
+        ("unstar_article", "unstar_article", {"article_id": 42}),
+    ],
+)
+async def test_tool_error_returns_string(tools, mock_client, tool, method, kwargs):
+    setattr(mock_client, method, _raises(RuntimeError("connection lost")))
+    mock_client.get_unread_counts = _returns({})
+
+    result = await getattr(tools, tool)(**kwargs)
+    assert result == "Error: connection lost"
+
+
+@pytest.mark.parametrize(
+    ("tool", "kwargs"),
+    [
+        ("mark_as_read", {"article_ids": [1, 2, 3]}),
+        ("mark_as_unread", {"article_ids": [1]}),
+        ("star_article", {"article_id": 42}),
+        ("unstar_article", {"article_id": 42}),
+    ],
+)
+async def test_write_tool_returns_ok(tools, mock_client, tool, kwargs):
+    setattr(mock_client, tool, _returns(True))
+
+    result = await getattr(tools, tool)(**kwargs)
+    assert result == "OK"